@@ -18,14 +18,32 @@ What's the difference between a 'SIMpath exam' and a 'SIMnet exam'?
     SIMpath exams are the pretest/lesson/posttest and are often just called 'SIMpath'
 """
 
+import hashlib
 import json
+import os
 import random
+import re
 import sys
+import threading
 import time
-from typing import Dict, Generator, List, Union
-from urllib.parse import quote_plus, urlencode, urlparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, quote_plus, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# loid, assignment_id and page slug of a simbook assignment url
+_SIMBOOK_URL_RE = re.compile(r"[?&]l=(\d+)&a=(\d+)&t=\d+&redirect_uri=[^#]*#(.+)$")
 
 
 class SIMPathNotStartedError(Exception):
@@ -36,6 +54,10 @@ class SIMNetExamNotStartedError(Exception):
     """A SIMnet exam has not begun, so questions cannot be answered yet"""
 
 
+class InvalidSimbookURLError(ValueError):
+    """A simbook assignment url did not have the expected shape"""
+
+
 class CLIError(Exception):
     """An error occurred with the arguments passed through the command line"""
 
@@ -59,10 +81,90 @@ class NotLoggedInError(LoginError):
     """User is not currently logged in"""
 
 
+def _parse_json(req: requests.Response):
+    """
+    Parse the JSON body of a response
+
+    Uses orjson on the raw bytes when it is installed, skipping the
+    intermediate str decode, and falls back to `requests`' own parser.
+    """
+    if orjson is not None:
+        return orjson.loads(req.content)
+    return req.json()
+
+
+def _parse_simbook_url(url: str) -> Tuple[str, str, str]:
+    """
+    Extract the loid, assignment id and page slug of a simbook assignment url
+
+    The precompiled regex handles the usual parameter order in one pass.
+    Urls with their parameters in any other order, or without `t` or
+    `redirect_uri`, fall back to `parse_qs`.
+
+    Raises:
+        InvalidSimbookURLError if `l`, `a` or the page slug fragment is missing
+    """
+    match = _SIMBOOK_URL_RE.search(url)
+    if match is not None:
+        return match.groups()
+
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    if "l" not in query or "a" not in query or not parts.fragment:
+        raise InvalidSimbookURLError(url)
+    return query["l"][0], query["a"][0], parts.fragment
+
+
+def _dump_json(obj: Any) -> bytes:
+    """
+    Serialize a request body to compact JSON bytes
+
+    Uses orjson when it is installed and the standard library otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 class SIMNet:
     """
     Base class for making requests to SIMnet API
     """
+    __slots__ = (
+        "school",
+        "base_url",
+        "headers",
+        "_json_headers",
+        "_save_headers",
+        "_answer_headers",
+        "_login_headers",
+        "_simbook_details_headers",
+        "_simbook_referer",
+        "_state",
+        "_rng",
+        "session",
+        "_details_cache",
+        "_save_cache",
+        "_save_cache_lock",
+        "cookie_path",
+        "_session_check",
+    )
+
+    # bit flags stored in `_state`
+    LOGGED_IN = 1
+    IN_SIMPATH = 2
+    IN_EXAM = 4
+
+    # number of completed simbook tasks remembered by `_save_cache`
+    SAVE_CACHE_SIZE = 4096
+
+    # (state flag, error raised when it is missing, message) checked by `_require`
+    _STATE_ERRORS = (
+        (LOGGED_IN, NotLoggedInError, "You are not logged in."),
+        (IN_SIMPATH, SIMPathNotStartedError, "You have not started a SIMpath exam."),
+        (IN_EXAM, SIMNetExamNotStartedError, "You have not started a SIMnet exam."),
+    )
+
     def __init__(self, school: str, api_key: str) -> None:
         """
         Args:
@@ -71,30 +173,132 @@ class SIMNet:
         """
         self.school = school.lower()
 
-        self.base_url = f"http://{self.school}.simnetonline.com"
+        self.base_url = f"https://{self.school}.simnetonline.com"
         self.headers = {
             "Host": f"{self.school}.simnetonline.com",
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:65.0) Gecko/20100101 Firefox/65.0",
             "Accept": "*/*",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
+            # includes br (and zstd) when urllib3 can decode them
+            "Accept-Encoding": ACCEPT_ENCODING,
             "X-ApiKey": api_key,
             "X-Requested-With": "XMLHttpRequest",
-            "Connection": "close",
         }
 
-        self.logged_in = False
-        self.is_in_simpath = False
-        self.is_in_exam = False
+        # per-endpoint header overrides, built once so requests only have to
+        # merge in their Referer. `self.headers` is sent by the session itself
+        self._json_headers = {
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+        }
+        # save endpoints answer with a tiny body that is not worth compressing
+        self._save_headers = {
+            "Accept-Encoding": "identity",
+        }
+        self._answer_headers = {
+            **self._json_headers,
+            **self._save_headers,
+            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+        }
+        self._login_headers = {
+            **self._json_headers,
+            "Referer": f"https://{self.school}.simnetonline.com/sp/",
+            "Content-Type": "application/json",
+        }
+        self._simbook_details_headers = {
+            "Referer": f"https://{self.school}.simnetonline.com/sp/",
+        }
+        # filled with the `loid` and `assignment_id` of a simbook task
+        self._simbook_referer = (
+            f"https://{self.school}.simnetonline.com/sb/?l={{loid}}&a={{assignment_id}}&t=5"
+            f"&redirect_uri=https%3A%2F%2F{self.school}.simnetonline.com%2Fsp%2F%23bo%2F{{assignment_id}}"
+        )
+
+        self._state = 0
+        self._rng = random.Random()
         self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
+        # parsed `/details` responses keyed by (assignment type, assignment id)
+        self._details_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # simbook tasks already saved, keyed by (loid, assignment id, page slug)
+        self._save_cache: "OrderedDict[Tuple[Any, Any, Any], bool]" = OrderedDict()
+        self._save_cache_lock = threading.Lock()
+
+        # keep one warm pool of connections to the school's host, large enough
+        # for the concurrent completions so sockets are reused, not reopened
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                # hand back the last response once retries run out, so
+                # callers can still report failure through `req.ok`
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # cookies of a previous login of the same user, set by `login()`
+        self.cookie_path: Optional[str] = None
+        # response hook installed by `login()` while a restored session is unverified
+        self._session_check: Optional[Callable[..., requests.Response]] = None
+
+    def _load_cookies(self) -> bool:
+        """
+        Restore the cookies saved by a previous successful login
+
+        A missing, unreadable or malformed file counts as no saved session.
 
-    def login(self, username: str, password: str) -> None:
+        Returns:
+            bool Whether or not any unexpired cookies were restored
+        """
+        try:
+            with open(self.cookie_path, mode="rb") as cookie_file:
+                saved = json.loads(cookie_file.read())
+            cookies = requests.cookies.RequestsCookieJar()
+            for cookie in saved:
+                cookies.set_cookie(requests.cookies.create_cookie(**cookie))
+        except (OSError, ValueError, TypeError):
+            # e.g. a file truncated by a run killed while saving it
+            return False
+        cookies.clear_expired_cookies()
+        self.session.cookies.update(cookies)
+        return len(cookies) > 0
+
+    def _save_cookies(self) -> None:
+        """Save the session cookies so later runs can skip logging in"""
+        saved = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires,
+                "secure": cookie.secure,
+            }
+            for cookie in self.session.cookies
+        ]
+        # the file holds a live session, so only the current user may read it
+        fd = os.open(self.cookie_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, mode="wb") as cookie_file:
+            cookie_file.write(_dump_json(saved))
+
+    def login(self, username: str, password: str, use_saved_session: bool = True) -> None:
         """
         Login to SIMnet
 
+        If cookies from a previous login of this user were restored, no
+        request is made. Should the server reject the restored session on the
+        first authenticated request, the cookie file is deleted, the user
+        signs in again and that request is retried.
+
         Args:
             username: str SIMnet username
             password: str SIMnet password
+            use_saved_session: bool Reuse cookies saved by a previous login
 
         Raises:
             CouldNotLoginError if login request is anything other than 200
@@ -102,14 +306,30 @@ class SIMNet:
         Returns:
             none
         """
-        login_headers = self.headers.copy()
-        login_headers.update({
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "Referer": f"https://{self.school}.simnetonline.com/sp/",
-            "Content-Type": "application/json",
-            "Content-Length": "28",
-        })
+        user_hash = hashlib.sha256(username.encode("utf-8")).hexdigest()[:16]
+        self.cookie_path = f".simnet_{self.school}_{user_hash}.cookies"
+
+        # a previous login's check must not also fire for this one
+        hooks = self.session.hooks["response"]
+        if self._session_check in hooks:
+            hooks.remove(self._session_check)
+        self._session_check = None
+
+        if use_saved_session and self._load_cookies():
+            self._session_check = self._saved_session_check(username, password)
+            hooks.append(self._session_check)
+            self._state |= self.LOGGED_IN
+            return
 
+        self._sign_in(username, password)
+
+    def _sign_in(self, username: str, password: str) -> None:
+        """
+        Send the credentials to SIMnet and save the resulting session cookies
+
+        Raises:
+            CouldNotLoginError if login request is anything other than 200
+        """
         login_data = {
             "u": username,
             "p": password,
@@ -117,8 +337,8 @@ class SIMNet:
 
         req = self.session.post(
             f"{self.base_url}/api/users/signin",
-            json=login_data,
-            headers=login_headers,
+            data=_dump_json(login_data),
+            headers=self._login_headers,
         )
 
         if not req.ok:
@@ -130,33 +350,146 @@ class SIMNet:
                 f"Password: {password}\n"
                 f"Response: {req.text}\n"
             )
-        self.logged_in = True
-
-    def login_required(func):
-        """Require that the user has already logged in before continuting"""
-        def _login_required(self, *args, **kwargs):
-            if not self.logged_in:
-                raise NotLoggedInError("You are not logged in.")
-            return func(self, *args, **kwargs)
-        return _login_required
-
-    def simpath_started_required(func):
-        """Require that a SIMpath exam has started before continuting"""
-        def _simpath_started_required(self, *args, **kwargs):
-            if not self.is_in_simpath:
-                raise SIMPathNotStartedError("You have not started a SIMpath exam.")
-            return func(self, *args, **kwargs)
-        return _simpath_started_required
-
-    def exam_started_required(func):
-        """Require that a SIMnet exam has started before continuting"""
-        def _exam_started_required(self, *args, **kwargs):
-            if not self.is_in_exam:
-                raise SIMNetExamNotStartedError("You have not started a SIMpath exam.")
-            return func(self, *args, **kwargs)
-        return _exam_started_required
-
-    @login_required
+        self._state |= self.LOGGED_IN
+        self._save_cookies()
+
+    def _saved_session_check(self, username: str, password: str) -> Callable[..., requests.Response]:
+        """
+        Build a response hook that validates a restored session on the first
+        response the session receives, signing in again if it was rejected
+
+        Args:
+            username: str SIMnet username
+            password: str SIMnet password
+
+        Returns:
+            callable Hook for `session.hooks["response"]`
+        """
+        lock = threading.Lock()
+        checked = False
+
+        def check(req: requests.Response, *args, **kwargs) -> requests.Response:
+            nonlocal checked
+            # concurrent first responses must not both run the check
+            with lock:
+                if checked:
+                    return req
+                checked = True
+            hooks = self.session.hooks["response"]
+            if check in hooks:
+                hooks.remove(check)
+            if req.status_code not in (401, 403):
+                return req
+
+            # release the rejected response's connection before retrying
+            req.close()
+            try:
+                os.remove(self.cookie_path)
+            except OSError:
+                pass
+            self.session.cookies.clear()
+            self._sign_in(username, password)
+
+            retry = req.request.copy()
+            retry.headers.pop("Cookie", None)
+            retry.prepare_cookies(self.session.cookies)
+            return self.session.send(retry, **kwargs)
+        return check
+
+    @property
+    def logged_in(self) -> bool:
+        return bool(self._state & self.LOGGED_IN)
+
+    @property
+    def is_in_simpath(self) -> bool:
+        return bool(self._state & self.IN_SIMPATH)
+
+    @property
+    def is_in_exam(self) -> bool:
+        return bool(self._state & self.IN_EXAM)
+
+    def _require(self, mask: int) -> None:
+        """
+        Require that every state flag in `mask` is set before continuing
+
+        Raises:
+            NotLoggedInError, SIMPathNotStartedError or SIMNetExamNotStartedError
+            for the first missing flag
+        """
+        if self._state & mask == mask:
+            return
+        for flag, error, message in self._STATE_ERRORS:
+            if mask & flag and not self._state & flag:
+                raise error(message)
+
+    def _copy_template(
+            self,
+            template: requests.PreparedRequest,
+            url: Optional[str] = None,
+            params: Optional[Dict[str, Any]] = None,
+        ) -> requests.PreparedRequest:
+        """
+        Copy a prepared request template with the session's current cookies
+
+        `prepare_request` freezes the Cookie header when the template is
+        built, so cookies the server set or rotated since then would
+        otherwise never be sent. The url is filled in before the cookies
+        are picked, so cookies scoped to its path are included.
+
+        Args:
+            template: PreparedRequest Template to copy
+            url: str Absolute url replacing the template's, if given
+            params: dict[str, Any] Query parameters added to `url`
+
+        Returns:
+            PreparedRequest Copy ready to have its body filled in
+        """
+        prepared = template.copy()
+        if url is not None:
+            prepared.prepare_url(url, params)
+        prepared.headers.pop("Cookie", None)
+        prepared.prepare_cookies(self.session.cookies)
+        return prepared
+
+    def _get_assignment_details(
+            self,
+            assignment_type: str,
+            assignment_id: Union[int, str],
+            params: Optional[Dict[str, str]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            use_cache: bool = True,
+        ) -> Dict[str, Any]:
+        """
+        Fetch the metadata of an assignment. Successful responses are cached,
+        so static metadata only hits the API the first time an assignment is
+        requested
+
+        Args:
+            assignment_type: str One of simbooks, simpaths, or exams
+            assignment_id: int|str Assignment ID matching \\d{7}
+            params: dict[str, str] Query parameters sent with the request
+            headers: dict[str, str] Headers sent with the request
+            use_cache: bool Whether or not the response may be served from and
+                            stored in the cache. Disable for responses that
+                            change over time
+
+        Returns:
+            dict Parsed JSON response
+        """
+        key = (assignment_type, str(assignment_id))
+        if use_cache and key in self._details_cache:
+            return self._details_cache[key]
+
+        req = self.session.get(
+            f"{self.base_url}/api/assignments/{assignment_type}/{assignment_id}/details",
+            params=params,
+            headers=headers,
+        )
+        details = _parse_json(req)
+        if use_cache and req.ok:
+            self._details_cache[key] = details
+        return details
+
     def complete_simbook_assignment_from_url(
             self,
             url: str,
@@ -176,42 +509,45 @@ class SIMNet:
             task_complete_id: int Task specific id. Matches \\d{9}
                               Successful completion does not depend on this value.
 
+        Raises:
+            InvalidSimbookURLError if the url has no `l`, `a` or page slug
+
         Returns:
             bool Whether or not the assignment was successfully completed
         """
-        assignment_headers = self.headers.copy()
-        assignment_headers.update({
-            "Referer": url,
-        })
+        self._require(self.LOGGED_IN)
+        assignment_headers = {**self._save_headers, "Referer": url}
 
         assignment_data = {
             "lessonType": "SIMbookLesson",
             "isComplete": True,
-            "timeSpent": random.randint(30, 230),
+            "timeSpent": self._rng.randint(30, 230),
         }
 
-        parsed_url = urlparse(url)
-
         # both `assignment_id` and `loid` identify workbook chapters
         # though, I am not totally sure of the difference
         # `assignment_id` has a length of 7 integers and `loid` has a length of 4
-        loid, assignment_id, _, _ = parsed_url.query.split("&")
-        page_slug = parsed_url.fragment
-
-        loid = loid.replace('l=', '')
-        assignment_id = assignment_id.replace('a=', '')
+        loid, assignment_id, page_slug = _parse_simbook_url(url)
 
         url = f"/api/simbooks/{loid}/save/{assignment_id}/{task_complete_id}/{page_slug}"
 
-        req = self.session.get(
+        # only the status is needed, so the body is drained without being
+        # decoded, which also hands the connection back to the pool
+        with self.session.get(
             f"{self.base_url}{url}",
             params=assignment_data,
             headers=assignment_headers,
-        )
-        return req.ok
+            stream=True,
+        ) as req:
+            req.raw.drain_conn()
+            return req.ok
 
-    @login_required
-    def complete_simbook_assignment_from_dict(self, assignment_dict: Dict[str, Union[str, int]]) -> bool:
+    def complete_simbook_assignment_from_dict(
+            self,
+            assignment_dict: Dict[str, Union[str, int]],
+            time_spent: Optional[int] = None,
+            template: Optional[requests.PreparedRequest] = None,
+        ) -> bool:
         """
         Complete a single simbook assignment from dictionary generated by
         `get_simbook_assignments()`
@@ -222,24 +558,38 @@ class SIMNet:
                                                      'assignment_id'
                                                      'task_complete_id'
                                                      'page_slug'
+            time_spent: int Seconds reported as spent on the task.
+                            Drawn at random between 30 and 232 if not given
+            template: PreparedRequest Save request from `_prepare_simbook_save()`
+                                      for this assignment. Prepared here if not given
 
         Returns:
             bool Whether or not the assignment was successfully completed
+                 Already completed assignments, and ones this instance
+                 already saved, are skipped and return True
         """
+        self._require(self.LOGGED_IN)
+        if assignment_dict.get("is_completed"):
+            return True
+
         loid = assignment_dict["loid"]
         assignment_id = assignment_dict["assignment_id"]
         task_complete_id = assignment_dict["task_complete_id"]
         page_slug = assignment_dict["page_slug"]
 
-        assignment_headers = self.headers.copy()
-        assignment_headers.update({
-            "Referer": f"http://{self.school}.simnetonline.com/sb/?l={loid}&a={assignment_id}&t=5&redirect_uri=https%3A%2F%2F{self.school}.simnetonline.com%2Fsp%2F%23bo%2F{assignment_id}",
-        })
+        key = (loid, assignment_id, page_slug)
+        with self._save_cache_lock:
+            if key in self._save_cache:
+                self._save_cache.move_to_end(key)
+                return True
+
+        if template is None:
+            template = self._prepare_simbook_save(assignment_dict)
 
         assignment_data = {
             "lessonType": "SIMbookLesson",
             "isComplete": True,
-            "timeSpent": random.randint(30, 232),
+            "timeSpent": self._rng.randint(30, 232) if time_spent is None else time_spent,
         }
 
         # init book
@@ -250,44 +600,68 @@ class SIMNet:
         url = f"/api/simbooks/{loid}/save/{assignment_id}/{task_complete_id}/{page_slug}_01"
                 # {'loid': 1754, 'assignment_id': 4100481, 'task_complete_id': 363571892, 'page_slug': 'ex16_sk_02_02', 'is_completed': False}
                 # /api/simbooks/1754/save/4100481/363571891/ex16_sk_02_01_01?lessonType=SIMbookLesson&isComplete=true&timeSpent=30
-        req = self.session.get(
-            f"{self.base_url}{url}",
-            params=assignment_data,
-            headers=assignment_headers,
-        )
-        print(assignment_dict, req.ok, req.reason, "\n\n", req.text)
+        # only the status is needed, so the body is drained without being
+        # decoded, which also hands the connection back to the pool
+        prepared = self._copy_template(template, f"{self.base_url}{url}", assignment_data)
+        with self.session.send(prepared, stream=True) as req:
+            req.raw.drain_conn()
+            print(assignment_dict, req.ok, req.reason)
 
         # exit book
         # self.session.get(
         #     f"{self.base_url}/api/simbooks/{loid}/exit/{assignment_id}?lessonType=5&_={int(time.time()*1000)}"
         # )
+        if req.ok:
+            with self._save_cache_lock:
+                self._save_cache[key] = True
+                if len(self._save_cache) > self.SAVE_CACHE_SIZE:
+                    self._save_cache.popitem(last=False)
         return req.ok
 
-    @login_required
+    def _prepare_simbook_save(self, assignment_dict: Dict[str, Union[str, int]]) -> requests.PreparedRequest:
+        """
+        Prepare the headers and cookies of the save request shared by every
+        task of a simbook assignment. Only the url differs between tasks.
+
+        Args:
+            assignment_dict: dict[str, str] Any task dictionary of the assignment
+
+        Returns:
+            PreparedRequest Template to be copied before filling in the url
+        """
+        return self.session.prepare_request(requests.Request(
+            "GET",
+            self.base_url,
+            headers={
+                **self._save_headers,
+                "Referer": self._simbook_referer.format_map(assignment_dict),
+            },
+        ))
+
     def get_simbook_assignments(
             self,
-            assignment_id: str
+            assignment_id: str,
+            include_completed: bool = True,
         ) -> Generator[Dict[str, str], None, None]:
         """
         Args:
             assignment_id: str Assignment ID matching \\d{7}
+            include_completed: bool Also yield tasks that were already completed
 
         Yields:
             dict[str, str] Information necessary to create request
         """
+        self._require(self.LOGGED_IN)
         print("Getting assignments")
-        simbook_assignment_headers = self.headers.copy()
-        simbook_assignment_headers.update({
-            "Referer": f"https://{self.school}.simnetonline.com/sp/"
-        })
-
-        req = self.session.get(
-            f"{self.base_url}/api/assignments/simbooks/{assignment_id}/details",
+        results = self._get_assignment_details(
+            "simbooks",
+            assignment_id,
             params={"lessonType": "0"},
-            headers=simbook_assignment_headers,
-        )
-
-        results = json.loads(req.text)["results"][0]
+            headers=self._simbook_details_headers,
+            # not memoized: `timesCompleted` changes as tasks are saved, and a
+            # stale copy would resend finished tasks or skip unfinished ones
+            use_cache=False,
+        )["results"][0]
         assignment_id = results["assignmentID"]
         loid = results["loid"]
         for task in results["tasks"]:
@@ -297,6 +671,8 @@ class SIMNet:
             # _01g guide_me
             page_slug = task["pageSlug"]
             is_completed = task["timesCompleted"] > 0
+            if is_completed and not include_completed:
+                continue
 
             # url = f"/api/simbooks/{loid}/save/{assignment_id}/{task_complete_id}/{page_slug}"
             yield ({
@@ -307,50 +683,132 @@ class SIMNet:
                 "is_completed": is_completed
             })
 
-    @login_required
+    def complete_all_simbook_assignments(
+            self,
+            assignment_id: str,
+            max_workers: int = 16
+        ) -> List[bool]:
+        """
+        Complete every unfinished task of a simbook assignment concurrently
+
+        Args:
+            assignment_id: str Assignment ID matching \\d{7}
+            max_workers: int Number of tasks completed at the same time
+
+        Returns:
+            list[bool] Whether or not each submitted task was successfully completed
+        """
+        self._require(self.LOGGED_IN)
+        all_assignments = list(self.get_simbook_assignments(assignment_id))
+        assignments = [
+            assignment for assignment in all_assignments
+            if not assignment["is_completed"]
+        ]
+        print(f"Skipping {len(all_assignments) - len(assignments)} completed tasks")
+        if not assignments:
+            return []
+
+        # every task shares the same assignment, so one template serves all
+        complete_assignment = partial(
+            self.complete_simbook_assignment_from_dict,
+            template=self._prepare_simbook_save(assignments[0]),
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                complete_assignment,
+                assignments,
+                self._rng.choices(range(30, 233), k=len(assignments)),
+            ))
+
     def complete_simbook(self, assignment_id: int) -> None:
-        for assignment in self.get_simbook_assignments(assignment_id):
-            if assignment["is_completed"]:
-                continue
-            time.sleep(assignment["timeSpent"])
-            self.complete_simbook_assignment_from_dict(assignment)
+        self._require(self.LOGGED_IN)
+        for assignment in self.get_simbook_assignments(assignment_id, include_completed=False):
+            time_spent = self._rng.randint(30, 232)
+            time.sleep(time_spent)
+            self.complete_simbook_assignment_from_dict(assignment, time_spent=time_spent)
             print(assignment)
 
-    @login_required
-    def complete_simpath_exam(self, assignment_id: int) -> None:
+    def complete_simpath_exam(self, assignment_id: int, max_workers: int = 32) -> None:
         """
         Complete a SIMpath exam
 
         assignment_id: int Length of 7. Probably starts with `4`
                            Can be found in url
+        max_workers: int Number of questions answered at the same time
         """
-        simpath_headers = self.headers.copy()
-        simpath_headers.update({
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "Referer": f"http://{self.school}.simnetonline.com/sp/?redirect_uri=https%3A%2F%2F{self.school}.simnetonline.com%2Fsp%2F%23pa%2F{assignment_id}",
-        })
+        self._require(self.LOGGED_IN)
+        self._run_exam_flow(kind="simpath", assignment_id=assignment_id, max_workers=max_workers)
 
-        # loid: int Length of 6. Probably starts with `1`
-        loid = json.loads(self.session.get(
-            f"{self.base_url}/api/assignments/simpaths/{assignment_id}/details?lessonType=4"
-        ).text)["loid"]
+    def complete_exam(self, assignment_id: int, max_workers: int = 32) -> None:
+        """
+        Complete a SIMnet exam
 
-        question_dicts: List[Dict[str, Union[int, str]]] = []
+        assignment_id: int Length of 7. Probably starts with `4`
+                           Can be found in url
+        max_workers: int Number of questions answered at the same time
+        """
+        self._require(self.LOGGED_IN)
+        self._run_exam_flow(kind="simnet", assignment_id=assignment_id, max_workers=max_workers)
+
+    def _run_exam_flow(
+            self,
+            *,
+            kind: str,
+            assignment_id: int,
+            max_workers: int = 32,
+        ) -> None:
+        """
+        Fetch the questions of an exam, start it, answer every question and
+        end it. SIMpath and SIMnet exams only differ in their endpoints.
+
+        kind: str Either `simpath` or `simnet`
+        assignment_id: int Length of 7. Probably starts with `4`
+                           Can be found in url
+        max_workers: int Number of questions answered at the same time
+        """
+        if kind == "simpath":
+            # loid: int Length of 6. Probably starts with `1`
+            loid = self._get_assignment_details(
+                "simpaths", assignment_id, params={"lessonType": "4"}
+            )["loid"]
+            url_prefix = "simpathexams"
+            referer_fragment = f"%23pa%2F{assignment_id}"
+            max_seconds_spent = 203
+            state_flag = self.IN_SIMPATH
+            complete_question = self._complete_simpath_question
+        elif kind == "simnet":
+            loid = self._get_assignment_details("exams", assignment_id)["loid"]
+            url_prefix = "simnetexams"
+            referer_fragment = f"%23se%2F{assignment_id}%2Fresult%2F1"
+            max_seconds_spent = 200
+            state_flag = self.IN_EXAM
+            complete_question = self._complete_exam_question
+        else:
+            raise ValueError(f"Unknown exam kind: {kind}")
+
+        # every answer shares these headers, only the body differs
+        answer_headers = {
+            **self._answer_headers,
+            "Referer": f"https://{self.school}.simnetonline.com/sp/?redirect_uri=https%3A%2F%2F{self.school}.simnetonline.com%2Fsp%2F{referer_fragment}",
+        }
+
+        question_dicts: List[Dict[str, Any]] = []
 
         req = self.session.get(
-            f"{self.base_url}/api/simpathexams/{loid}/init/{assignment_id}/1"
+            f"{self.base_url}/api/{url_prefix}/{loid}/init/{assignment_id}/1"
         )
 
-        j = json.loads(req.text)
+        j = _parse_json(req)
         seconds_remaining = 600_000
         assignment_id = j["assignmentID"]
         loid = j["loid"]
         content_version = j["contentVersion"]
-        for question in j["questions"]:
+        save_url = f"{self.base_url}/api/{url_prefix}/{loid}/saveanswer/{assignment_id}/1"
+        times_spent = self._rng.choices(range(23, max_seconds_spent + 1), k=len(j["questions"]))
+        for question, seconds_spent in zip(j["questions"], times_spent):
             question_id = question["id"]
             readable_answer = question["hint"]
             attempt = question["attempts"] + 1
-            seconds_spent = random.randint(23, 203)
             seconds_remaining -= seconds_spent
             question_dicts.append({
                 "assignment_id": assignment_id,
@@ -360,29 +818,64 @@ class SIMNet:
                 "attempt": attempt,
                 "content_version": content_version,
                 "seconds_spent": seconds_spent,
-                "seconds_remaining": seconds_remaining
+                "seconds_remaining": seconds_remaining,
             })
 
         # start exam
         self.session.get(
-            f"{self.base_url}/api/simpathexams/{loid}/start/{assignment_id}/1"
+            f"{self.base_url}/api/{url_prefix}/{loid}/start/{assignment_id}/1"
         )
 
-        self.is_in_simpath = True
+        self._state |= state_flag
+        try:
+            self._complete_questions_batch(
+                complete_question,
+                question_dicts,
+                save_url=save_url,
+                headers=answer_headers,
+                max_workers=max_workers,
+            )
 
-        for question in question_dicts:
-            time.sleep(question["seconds_spent"])
-            self._complete_simpath_question(**question)
+            # end exam
+            self.session.get(
+                f"{self.base_url}/api/{url_prefix}/{loid}/end/{assignment_id}/1?seconds={seconds_remaining}"
+            )
+        finally:
+            self._state &= ~state_flag
 
-        # end exam
-        self.session.get(
-            f"{self.base_url}/api/simpathexams/{loid}/end/{assignment_id}/1?seconds={seconds_remaining}"
+    def _complete_questions_batch(
+            self,
+            complete_question: Callable[..., None],
+            questions: List[Dict[str, Any]],
+            *,
+            save_url: str,
+            headers: Dict[str, str],
+            max_workers: int = 32,
+        ) -> None:
+        """
+        Complete every question of an exam as one client-side batch
+
+        complete_question: callable `_complete_simpath_question` or `_complete_exam_question`
+        questions: list[dict] Keyword arguments for `complete_question`
+        save_url: str Absolute url answers to this exam are posted to
+        headers: dict[str, str] Headers shared by every answer of this exam
+        max_workers: int Number of questions answered at the same time
+        """
+        # prepared once so each answer only has to fill in its body
+        template = self.session.prepare_request(
+            requests.Request("POST", save_url, headers=headers)
         )
 
-        self.is_in_simpath = False
+        def answer_question(question: Dict[str, Any]) -> None:
+            print(f"Sleeping for {question['seconds_spent']}")
+            time.sleep(question["seconds_spent"])
+            complete_question(template=template, **question)
+
+        # answers are independent of each other, so the time spent on each
+        # question overlaps rather than adding up
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(answer_question, questions))
 
-    @login_required
-    @simpath_started_required
     def _complete_simpath_question(
             self,
             *,
@@ -392,6 +885,7 @@ class SIMNet:
             seconds_spent: int,
             seconds_remaining: int,
             readable_answer: str,
+            template: requests.PreparedRequest,
             content_version: str = "V3",
             attempt: int = 1,
         ):
@@ -403,6 +897,8 @@ class SIMNet:
         assignment_id: int Length of 7. Probably starts with `4`
         question_id: str Question specific id. (e.g. ex16_sk_02_01_01_p_01)
         seconds_spent: int Amount of time spent working on the question
+        template: PreparedRequest Answer request without a body, shared by
+                                  every question of this exam
         content_version: str SIMnet specific versioning system.
                              Will likely be "V3"
         attempt: int Current number of attempts + 1
@@ -411,12 +907,7 @@ class SIMNet:
                              be <span class="username">You</span> clicked
                              <b>Ctrl + C</b>.
         """
-        simpath_headers = self.headers.copy()
-        simpath_headers.update({
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "Referer": f"http://{self.school}.simnetonline.com/sp/?redirect_uri=https%3A%2F%2F{self.school}.simnetonline.com%2Fsp%2F%23pa%2F{assignment_id}",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
-        })
+        self._require(self.LOGGED_IN | self.IN_SIMPATH)
         simpath_data = {
             "contentVersion": content_version,
             "questionID": question_id, #ex16_sk_02_01_01_p_01
@@ -429,82 +920,10 @@ class SIMNet:
             "lessonType": 4
         }
 
-        simpath_headers.update({"Content-Length": str(len(urlencode(simpath_data)))})
-
-        self.session.post(
-            f"{self.base_url}/api/simpathexams/{loid}/saveanswer/{assignment_id}/1",
-            headers=simpath_headers,
-            params=simpath_data
-        )
-
-    @login_required
-    def complete_exam(self, assignment_id: int) -> None:
-        """
-        Complete a SIMnet exam
-
-        assignment_id: int Length of 7. Probably starts with `4`
-                           Can be found in url
-        """
-        simpath_headers = self.headers.copy()
-        simpath_headers.update({
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "Referer": f"http://{self.school}.simnetonline.com/sp/?redirect_uri=https%3A%2F%2F{self.school}.simnetonline.com%2Fsp%2F%23pa%2F{assignment_id}",
-        })
-
-        # loid: int Length of 6. Probably starts with `1`
-        loid = json.loads(self.session.get(
-            f"{self.base_url}/api/assignments/exams/{assignment_id}/details"
-        ).text)["loid"]
+        prepared = self._copy_template(template)
+        prepared.prepare_body(data=simpath_data, files=None)
+        self.session.send(prepared)
 
-        question_dicts: List[Dict[str, Union[int, str]]] = []
-
-        req = self.session.get(
-            f"{self.base_url}/api/simnetexams/{loid}/init/{assignment_id}/1"
-        )
-
-        j = json.loads(req.text)
-        seconds_remaining = 600_000
-        assignment_id = j["assignmentID"]
-        loid = j["loid"]
-        content_version = j["contentVersion"]
-        for question in j["questions"]:
-            question_id = question["id"]
-            readable_answer = question["hint"]
-            attempt = question["attempts"] + 1
-            seconds_spent = random.randint(23, 200)
-            seconds_remaining -= seconds_spent
-            question_dicts.append({
-                "assignment_id": assignment_id,
-                "loid": loid,
-                "question_id": question_id,
-                "readable_answer": readable_answer,
-                "attempt": attempt,
-                "content_version": content_version,
-                "seconds_spent": seconds_spent,
-                "seconds_remaining": seconds_remaining
-            })
-
-        # start exam
-        self.session.get(
-            f"{self.base_url}/api/simnetexams/{loid}/start/{assignment_id}/1"
-        )
-
-        self.is_in_exam = True
-
-        for question in question_dicts:
-            print(f"Sleeping for {question['seconds_spent']}")
-            time.sleep(question["seconds_spent"])
-            self._complete_exam_question(**question)
-
-        # end exam
-        self.session.get(
-            f"{self.base_url}/api/simnetexams/{loid}/end/{assignment_id}/1?seconds={seconds_remaining}"
-        )
-
-        self.is_in_exam = False
-
-    @login_required
-    @exam_started_required
     def _complete_exam_question(
             self,
             *,
@@ -514,6 +933,7 @@ class SIMNet:
             seconds_spent: int,
             seconds_remaining: int,
             readable_answer: str,
+            template: requests.PreparedRequest,
             content_version: str = "V3",
             attempt: int = 1,
         ) -> None:
@@ -525,6 +945,8 @@ class SIMNet:
         assignment_id: int Length of 7. Probably starts with `4`
         question_id: str Question specific id. (e.g. ex16_sk_02_01_01_p_01)
         seconds_spent: int Amount of time spent working on the question
+        template: PreparedRequest Answer request without a body, shared by
+                                  every question of this exam
         content_version: str SIMnet specific versioning system.
                              Will likely be "V3"
         attempt: int Current number of attempts + 1
@@ -533,13 +955,7 @@ class SIMNet:
                              be <span class="username">You</span> clicked
                              <b>Ctrl + C</b>.
         """
-        exam_headers = self.headers.copy()
-        exam_headers.update({
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "Referer": f"http://{self.school}.simnetonline.com/sp/?redirect_uri=https%3A%2F%2F{self.school}.simnetonline.com%2Fsp%2F%23se%2F{assignment_id}%2Fresult%2F1",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
-        })
-
+        self._require(self.LOGGED_IN | self.IN_EXAM)
         exam_data = {
             "contentVersion": content_version,
             "questionID": question_id, #ex16_sk_02_01_01_p_01
@@ -551,13 +967,9 @@ class SIMNet:
             "isCorrect": True,
         }
 
-        exam_headers.update({"Content-Length": str(len(urlencode(exam_data)))})
-
-        self.session.post(
-            f"/api/simnetexams/{loid}/saveanswer/{assignment_id}/1",
-            headers=exam_headers,
-            params=exam_data
-        )
+        prepared = self._copy_template(template)
+        prepared.prepare_body(data=exam_data, files=None)
+        self.session.send(prepared)
 
 def handle_args(args):
     if len(args) > 3: